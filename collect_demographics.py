@@ -4,8 +4,51 @@ from datetime import datetime
 import os
 import csv
 import locale
+import argparse
+import shutil
 
-def collect_demographic_data():
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+except ImportError:
+    # Le stockage partitionné (Parquet) est optionnel
+    pa = None
+    pads = None
+
+def save_partitioned_data(data, dataset_dir, partition_by='annee'):
+    """Sauvegarde les données au format Parquet, partitionnées par année ou par pays.
+
+    Chaque partition est un sous-dossier (ex. annee=2020/) que le tableau de
+    bord ne lit que lorsqu'un graphique en a besoin.
+    """
+    if pads is None:
+        raise ImportError("pyarrow est nécessaire pour le stockage partitionné")
+    
+    records = [item for item in data if item.get('value') is not None]
+    table = pa.table({
+        'pays': pa.array([item['country']['value'] for item in records], pa.string()),
+        'code_pays': pa.array([item['country']['id'] for item in records], pa.string()),
+        'annee': pa.array([int(item['date']) for item in records], pa.int32()),
+        'valeur': pa.array([float(item['value']) for item in records], pa.float64())
+    })
+    
+    # Trier par année pour des groupes de lignes compacts (filtrage efficace)
+    table = table.sort_by([('annee', 'ascending'), ('pays', 'ascending')])
+    
+    # Supprimer l'ancienne version : un autre partitionnement laisserait des doublons
+    if os.path.isdir(dataset_dir):
+        shutil.rmtree(dataset_dir)
+    
+    pads.write_dataset(
+        table,
+        dataset_dir,
+        format='parquet',
+        partitioning=[partition_by],
+        partitioning_flavor='hive',
+        existing_data_behavior='overwrite_or_ignore'
+    )
+
+def collect_demographic_data(partitioned=False, partition_by='annee'):
     # Configurer le format des nombres pour utiliser la virgule comme séparateur décimal
     locale.setlocale(locale.LC_NUMERIC, 'fr_FR.UTF-8')
     
@@ -129,8 +172,18 @@ def collect_demographic_data():
         data = get_data(indicator_code)
         
         if data:
-            # Sauvegarder les données
-            save_data(data, filename, indicator_info)
+            # Sauvegarder les données et supprimer l'autre format,
+            # sinon le tableau de bord pourrait lire une version périmée
+            dataset_dir = os.path.splitext(filename)[0]
+            if partitioned:
+                save_partitioned_data(data, dataset_dir, partition_by)
+                if os.path.exists(filename):
+                    os.remove(filename)
+                filename = dataset_dir
+            else:
+                save_data(data, filename, indicator_info)
+                if os.path.isdir(dataset_dir):
+                    shutil.rmtree(dataset_dir)
             print(f"Données sauvegardées dans : {filename}")
             print(f"Nombre total d'enregistrements: {len(data)}")
             
@@ -141,6 +194,13 @@ def collect_demographic_data():
             print(f"Aucune donnée trouvée pour {indicator_info['description']}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collecte des données démographiques mondiales")
+    parser.add_argument('--partitionne', action='store_true',
+                        help="Écrire les données au format Parquet partitionné au lieu de CSV")
+    parser.add_argument('--partition', choices=['annee', 'code_pays'], default='annee',
+                        help="Colonne de partitionnement (défaut : annee)")
+    args = parser.parse_args()
+    
     print("Début de la collecte des données démographiques mondiales...")
-    collect_demographic_data()
+    collect_demographic_data(partitioned=args.partitionne, partition_by=args.partition)
     print("Collecte terminée!")
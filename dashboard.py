@@ -1,37 +1,69 @@
 import os
+import argparse
+import contextlib
+import html as html_lib
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import dash
-from dash import dcc, html
+from dash import dcc, html, ctx, Patch
 from dash.dependencies import Input, Output
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+except ImportError:
+    # Le stockage partitionné (Parquet) est optionnel
+    pa = None
+    pads = None
+
 # Dictionnaire pour stocker les correspondances entre noms d'affichage et noms de fichiers
 INDICATOR_MAPPING = {}
 
+# Dossier des données et indicateurs stockés au format partitionné
+DATA_DIR = 'donnees_demographiques'
+PARTITIONED_INDICATORS = set()
+
+# Nombre de partitions annuelles gardées en mémoire
+PARTITION_CACHE_SIZE = 16
+
+# Nombre de lignes regroupées avant chaque agrégation lors d'un parcours par lots
+SCAN_CHUNK_ROWS = 1_000_000
+
 # Configuration des indicateurs
 INDICATORS = {
     'population_totale': {
         'display': 'Population totale',
         'unit': 'habitants',
-        'format': '.0f'
+        'format': '.0f',
+        'interpolation': 'log'
     },
     'taux_de_fécondité': {
         'display': 'Taux de fécondité',
         'unit': 'enfants par femme',
-        'format': '.1f'
+        'format': '.1f',
+        'bounds': (0, None)
     },
     'taux_de_mortalité': {
         'display': 'Taux de mortalité',
         'unit': 'décès/1000 habitants',
-        'format': '.1f'
+        'format': '.1f',
+        'bounds': (0, None)
     },
     'espérance_de_vie': {
         'display': 'Espérance de vie',
         'unit': 'années',
-        'format': '.1f'
+        'format': '.1f',
+        'bounds': (0, None)
     },
     'croissance_de_la_population': {
         'display': 'Croissance de la population',
@@ -41,10 +73,26 @@ INDICATORS = {
     'population_urbaine_en_pourcentage': {
         'display': 'Population urbaine',
         'unit': '% de la population totale',
-        'format': '.1f'
+        'format': '.1f',
+        'bounds': (0, 100)
     }
 }
 
+# Bornes de l'axe temporel du tableau de bord (voir le curseur des années)
+FIRST_YEAR = 1960
+LAST_YEAR = 2025
+
+# Nombre maximal d'années projetées après la dernière observation d'un pays
+PROJECTION_HORIZON = 3
+
+# Nombre d'observations récentes utilisées pour estimer la tendance
+TREND_WINDOW = 5
+
+# Budget de points pour le graphique de tous les pays (au-delà : sous-échantillonnage)
+MAX_EVOLUTION_POINTS = 20000
+MIN_POINTS_PER_SERIES = 8
+BAND_POINTS = 500
+
 # Définir les unités pour chaque indicateur
 UNITS = {
     'population_totale': 'habitants',
@@ -156,13 +204,65 @@ def get_file_name(display_name):
     """Convertit un nom d'affichage en nom de fichier."""
     return INDICATOR_MAPPING.get(display_name, '')
 
-def load_data(indicator):
-    """Charge les données pour un indicateur donné."""
-    filename = os.path.join('donnees_demographiques', f"{indicator}.csv")
+def dataset_version(indicator):
+    """Date de modification du dossier d'un indicateur partitionné.
+
+    Le collecteur réécrit entièrement le dossier : cette date sert de clé aux
+    caches, qui sont ainsi invalidés après une nouvelle collecte.
+    """
+    try:
+        return os.stat(os.path.join(DATA_DIR, indicator)).st_mtime_ns
+    except OSError:
+        return None
+
+@lru_cache(maxsize=PARTITION_CACHE_SIZE)
+def _open_partitioned(indicator, version):
+    return pads.dataset(os.path.join(DATA_DIR, indicator), format='parquet',
+                        partitioning='hive')
+
+def open_partitioned(indicator):
+    """Ouvre le jeu de données Parquet partitionné d'un indicateur (mis en cache)."""
+    return _open_partitioned(indicator, dataset_version(indicator))
+
+def is_partitioned_dataset(indicator):
+    """Vérifie qu'un dossier contient un jeu de données lisible pour un indicateur connu."""
+    if indicator not in INDICATORS:
+        return False
+    try:
+        schema = pads.dataset(os.path.join(DATA_DIR, indicator), format='parquet',
+                              partitioning='hive').schema
+    except Exception as e:
+        print(f"Erreur lors de la lecture du dossier {indicator}: {e}")
+        return False
+    return {'pays', 'annee', 'valeur'}.issubset(schema.names)
+
+def load_data(indicator, years=None, countries=None):
+    """Charge les données pour un indicateur donné.
+
+    Si l'indicateur est stocké au format partitionné, les filtres sur les
+    années et les pays sont transmis à la lecture : seules les partitions
+    et les groupes de lignes concernés sont lus.
+    """
+    if indicator in PARTITIONED_INDICATORS:
+        filename = os.path.join(DATA_DIR, indicator)
+    else:
+        filename = os.path.join(DATA_DIR, f"{indicator}.csv")
     
     try:
-        # Ignorer les lignes qui commencent par #
-        df = pd.read_csv(filename, comment='#')
+        if indicator in PARTITIONED_INDICATORS:
+            condition = None
+            if years is not None:
+                condition = pads.field('annee').isin([int(y) for y in years])
+            if countries is not None:
+                country_condition = pads.field('pays').isin(list(countries))
+                condition = country_condition if condition is None else condition & country_condition
+            
+            table = open_partitioned(indicator).to_table(
+                columns=['pays', 'code_pays', 'annee', 'valeur'], filter=condition)
+            df = table.to_pandas()
+        else:
+            # Ignorer les lignes qui commencent par #
+            df = pd.read_csv(filename, comment='#')
         
         # Renommer les colonnes si nécessaire
         df.columns = ['pays', 'code_pays', 'annee', 'valeur']
@@ -173,11 +273,238 @@ def load_data(indicator):
         # Convertir la valeur en float
         df['valeur'] = pd.to_numeric(df['valeur'], errors='coerce')
         
+        if indicator not in PARTITIONED_INDICATORS:
+            if years is not None:
+                df = df[df['annee'].isin(years)]
+            if countries is not None:
+                df = df[df['pays'].isin(countries)]
+        
         return df
     except Exception as e:
         print(f"Erreur lors du chargement de {filename}: {e}")
         return pd.DataFrame(columns=['pays', 'code_pays', 'annee', 'valeur'])
 
+def list_years(indicator):
+    """Liste les années disponibles d'un indicateur partitionné."""
+    return tuple(int(y) for y in load_yearly_stats(indicator)['annee'])
+
+@lru_cache(maxsize=PARTITION_CACHE_SIZE)
+def _load_year(indicator, year, version):
+    return load_data(indicator, years=[year]).assign(estime=False)
+
+def load_year(indicator, year):
+    """Charge une seule année d'un indicateur partitionné (valeurs observées)."""
+    return _load_year(indicator, year, dataset_version(indicator))
+
+def _yearly_aggregates(data):
+    """Agrège par année la somme, le nombre, le minimum et le maximum des valeurs."""
+    data = data.dropna(subset=['annee', 'valeur']).reset_index(drop=True)
+    grouped = data.groupby('annee')['valeur']
+    
+    # Trouver les pays avec les valeurs min et max
+    aggregates = pd.DataFrame({
+        'somme': grouped.sum(),
+        'nombre': grouped.count(),
+        'minimum': grouped.min(),
+        'maximum': grouped.max(),
+        'pays_min': data.loc[grouped.idxmin(), 'pays'].to_numpy(),
+        'pays_max': data.loc[grouped.idxmax(), 'pays'].to_numpy()
+    })
+    return aggregates.rename_axis('annee').reset_index()
+
+def _merge_aggregates(first, second):
+    """Combine deux agrégats annuels partiels."""
+    data = pd.concat([first, second], ignore_index=True)
+    grouped = data.groupby('annee')
+    aggregates = pd.DataFrame({
+        'somme': grouped['somme'].sum(),
+        'nombre': grouped['nombre'].sum(),
+        'minimum': grouped['minimum'].min(),
+        'maximum': grouped['maximum'].max(),
+        'pays_min': data.loc[grouped['minimum'].idxmin(), 'pays_min'].to_numpy(),
+        'pays_max': data.loc[grouped['maximum'].idxmax(), 'pays_max'].to_numpy()
+    })
+    return aggregates.rename_axis('annee').reset_index()
+
+def _finalize_stats(aggregates):
+    """Transforme des agrégats annuels en statistiques (moyenne, min, max)."""
+    stats = aggregates.assign(moyenne=aggregates['somme'] / aggregates['nombre'])
+    return stats[['annee', 'moyenne', 'minimum', 'maximum', 'pays_min', 'pays_max']]
+
+def compute_yearly_stats(data):
+    """Calcule la moyenne, le minimum et le maximum de chaque année."""
+    return _finalize_stats(_yearly_aggregates(data))
+
+def load_yearly_stats(indicator):
+    """Statistiques annuelles d'un indicateur partitionné (mises en cache)."""
+    try:
+        return _load_yearly_stats(indicator, dataset_version(indicator))
+    except Exception as e:
+        # Les erreurs ne sont pas mises en cache : une collecte en cours peut se terminer
+        print(f"Erreur lors du calcul des statistiques de {indicator}: {e}")
+        return compute_yearly_stats(pd.DataFrame(columns=['pays', 'annee', 'valeur']))
+
+@lru_cache(maxsize=PARTITION_CACHE_SIZE)
+def _load_yearly_stats(indicator, version):
+    """Calcule les statistiques annuelles d'un indicateur partitionné.
+
+    Le jeu de données est parcouru une seule fois, par lots regroupés en
+    blocs d'au plus SCAN_CHUNK_ROWS lignes, en ne lisant que les colonnes
+    utiles : la mémoire reste bornée par la taille d'un bloc.
+    """
+    aggregates = _yearly_aggregates(pd.DataFrame(columns=['pays', 'annee', 'valeur']))
+    pending = []
+    pending_rows = 0
+    
+    def flush(aggregates):
+        chunk = pa.Table.from_batches(pending).to_pandas()
+        pending.clear()
+        chunk_aggregates = _yearly_aggregates(chunk)
+        if aggregates.empty:
+            return chunk_aggregates
+        return _merge_aggregates(aggregates, chunk_aggregates)
+    
+    dataset = _open_partitioned(indicator, version)
+    for batch in dataset.to_batches(columns=['pays', 'annee', 'valeur']):
+        if batch.num_rows == 0:
+            continue
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= SCAN_CHUNK_ROWS:
+            aggregates = flush(aggregates)
+            pending_rows = 0
+    if pending:
+        aggregates = flush(aggregates)
+    return _finalize_stats(aggregates)
+
+def load_evolution_data(indicator):
+    """Données du graphique de tous les pays, limitées aux séries et années affichées.
+
+    Retourne les données et, si toutes les séries ne peuvent pas être
+    affichées, les statistiques annuelles servant de bandes.
+    """
+    if indicator not in PARTITIONED_INDICATORS:
+        return datasets[indicator], None
+    
+    years = list_years(indicator)
+    if not years:
+        return load_year(indicator, DEFAULT_YEAR), None
+    latest = load_year(indicator, years[-1]).set_index('pays')['valeur']
+    n_series, n_points, with_bands = plan_evolution_budget(len(latest), len(years))
+    
+    # Ne lire que les séries et les années retenues par le budget de points
+    countries = None
+    if with_bands:
+        countries = select_series(latest, n_series)
+    if n_points < len(years):
+        positions = np.unique(np.linspace(0, len(years) - 1, n_points).round().astype(int))
+        years = [years[i] for i in positions]
+    data = load_data(indicator, years=years, countries=countries).assign(estime=False)
+    return data, load_yearly_stats(indicator) if with_bands else None
+
+def to_matrix(df, years=None):
+    """Transforme les données longues en matrice pays × années."""
+    matrix = df.pivot_table(index='pays', columns='annee', values='valeur',
+                            aggfunc='first')
+    matrix.columns = matrix.columns.astype(int)
+    if years is not None:
+        matrix = matrix.reindex(columns=years)
+    return matrix
+
+def fill_and_project(df, indicator):
+    """Complète les trous et projette les années récentes pour un indicateur.
+
+    Les années manquantes entre deux observations sont interpolées
+    (linéairement, ou en logarithme si l'indicateur le demande) et chaque
+    pays est prolongé d'au plus PROJECTION_HORIZON années selon la tendance
+    de ses TREND_WINDOW dernières valeurs. Tous les calculs portent sur la
+    matrice pays × années entière. La colonne 'estime' signale les valeurs
+    calculées.
+    """
+    df = df.dropna(subset=['annee', 'valeur'])
+    if df.empty:
+        return df.assign(estime=pd.Series(dtype=bool))
+
+    config = INDICATORS.get(indicator, {})
+    years = np.arange(int(df['annee'].min()),
+                      max(LAST_YEAR, int(df['annee'].max())) + 1)
+    matrix = to_matrix(df, years)
+    original = matrix.to_numpy(dtype=float)
+    observed = ~np.isnan(original)
+
+    # Interpolation log-linéaire pour les indicateurs à croissance exponentielle
+    log_scale = config.get('interpolation') == 'log'
+    if log_scale:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.where(original > 0, np.log(original), np.nan)
+    else:
+        values = original
+
+    n_years = len(years)
+    positions = np.arange(n_years)
+    rows = np.arange(values.shape[0])[:, None]
+    valid = ~np.isnan(values)
+
+    # Position de l'observation précédente et de la suivante pour chaque case
+    prev_idx = np.maximum.accumulate(np.where(valid, positions, -1), axis=1)
+    next_idx = np.minimum.accumulate(
+        np.where(valid, positions, n_years)[:, ::-1], axis=1)[:, ::-1]
+
+    # Trous internes : interpolation entre les deux observations encadrantes
+    gaps = ~valid & (prev_idx >= 0) & (next_idx < n_years)
+    prev_val = values[rows, np.clip(prev_idx, 0, n_years - 1)]
+    next_val = values[rows, np.clip(next_idx, 0, n_years - 1)]
+    weight = (positions - prev_idx) / np.where(gaps, next_idx - prev_idx, 1)
+    filled = np.where(gaps, prev_val + weight * (next_val - prev_val), values)
+
+    # Tendance par moindres carrés sur les dernières valeurs de chaque pays
+    last_idx = prev_idx[:, -1]
+    window_idx = last_idx[:, None] - np.arange(TREND_WINDOW)[::-1]
+    window = np.where(window_idx >= 0,
+                      filled[rows, np.clip(window_idx, 0, None)], np.nan)
+    in_window = ~np.isnan(window)
+    count = in_window.sum(axis=1)
+    x = np.where(in_window, window_idx, 0.0)
+    y = np.where(in_window, window, 0.0)
+    x_mean = x.sum(axis=1) / np.maximum(count, 1)
+    y_mean = y.sum(axis=1) / np.maximum(count, 1)
+    dx = np.where(in_window, x - x_mean[:, None], 0.0)
+    dy = np.where(in_window, y - y_mean[:, None], 0.0)
+    denom = (dx ** 2).sum(axis=1)
+    slope = np.where(denom > 0, (dx * dy).sum(axis=1) / np.where(denom > 0, denom, 1), 0.0)
+
+    # Projection au-delà de la dernière observation, dans la limite de l'horizon
+    ahead = positions - last_idx[:, None]
+    to_project = (last_idx[:, None] >= 0) & (ahead > 0) & (ahead <= PROJECTION_HORIZON)
+    last_val = filled[rows[:, 0], np.clip(last_idx, 0, None)]
+    filled = np.where(to_project, last_val[:, None] + slope[:, None] * ahead, filled)
+
+    if log_scale:
+        filled = np.exp(filled)
+    lower, upper = config.get('bounds', (None, None))
+    if lower is not None or upper is not None:
+        filled = np.clip(filled,
+                         -np.inf if lower is None else lower,
+                         np.inf if upper is None else upper)
+
+    result = np.where(observed, original, filled)
+    estimated = ~observed & ~np.isnan(result)
+
+    codes = df.groupby('pays')['code_pays'].first().reindex(matrix.index)
+    filled_df = pd.DataFrame({
+        'pays': np.repeat(matrix.index.to_numpy(), n_years),
+        'code_pays': np.repeat(codes.to_numpy(), n_years),
+        'annee': np.tile(years, len(matrix.index)),
+        'valeur': result.ravel(),
+        'estime': estimated.ravel()
+    })
+    filled_df = filled_df[~np.isnan(filled_df['valeur'])].reset_index(drop=True)
+    filled_df['annee'] = filled_df['annee'].astype('Int64')
+
+    print(f"{indicator} : {int(estimated.sum())} valeurs estimées "
+          f"({int(gaps.sum())} interpolées, {int((to_project & ~observed).sum())} projetées)")
+    return filled_df
+
 def create_top10_evolution(df):
     """Créer le graphique d'évolution des 10 pays les plus peuplés actuellement"""
     # Obtenir l'année la plus récente
@@ -200,15 +527,23 @@ def create_top10_evolution(df):
         country_data = df_top10[df_top10['pays'] == country]
         country_name_fr = REAL_COUNTRIES[country]
         
+        estimated = country_data['estime'] if 'estime' in country_data else None
+        
         fig.add_trace(
             go.Scatter(
                 x=country_data['annee'],
                 y=country_data['valeur'],
                 name=country_name_fr,
+                mode='lines+markers',
                 line=dict(
                     color=COUNTRY_COLORS.get(country_name_fr, '#000000'),
                     width=2
                 ),
+                # Marqueurs creux sur les années estimées
+                marker=dict(
+                    symbol='circle-open',
+                    size=0 if estimated is None else [6 if e else 0 for e in estimated]
+                ),
                 hovertemplate="%{x}<br>" +
                              f"{country_name_fr}: " +
                              "%{y:,.0f} habitants<br>" +
@@ -239,31 +574,329 @@ def create_top10_evolution(df):
     
     return fig
 
-# Charger les données
-print("\nChargement des données...")
-data_dir = 'donnees_demographiques'
-datasets = {}
+def _lttb_rows(x, y, threshold):
+    """LTTB sur des lignes sans valeurs manquantes aux extrémités."""
+    n_series, n_points = y.shape
+    if threshold >= n_points:
+        return np.broadcast_to(x, y.shape), y
+    
+    rows = np.arange(n_series)
+    selected = np.empty((n_series, threshold), dtype=int)
+    selected[:, 0] = 0
+    selected[:, -1] = n_points - 1
+    
+    # Bornes des seaux entre le premier et le dernier point
+    edges = np.linspace(1, n_points - 1, threshold - 1).astype(int)
+    anchor = np.zeros(n_series, dtype=int)
+    
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n_points
+        
+        # Point moyen du seau suivant (en ignorant les valeurs manquantes)
+        next_y = y[:, end:next_end]
+        next_count = (~np.isnan(next_y)).sum(axis=1)
+        avg_x = x[end:next_end].mean()
+        avg_y = np.nansum(next_y, axis=1) / np.where(next_count > 0, next_count, np.nan)
+        
+        # Aire du triangle formé avec le point retenu précédemment
+        anchor_x = x[anchor][:, None]
+        anchor_y = y[rows, anchor][:, None]
+        area = np.abs((anchor_x - avg_x) * (y[:, start:end] - anchor_y)
+                      - (anchor_x - x[start:end]) * (avg_y[:, None] - anchor_y))
+        area = np.where(np.isnan(area), -1, area)
+        
+        anchor = start + area.argmax(axis=1)
+        selected[:, i + 1] = anchor
+    
+    return x[selected], y[rows[:, None], selected]
 
-# Créer le mapping des indicateurs et charger les données
-print("\nCréation du mapping des indicateurs...")
-for file in os.listdir(data_dir):
-    if file.endswith('.csv'):
-        base_name = file.replace('.csv', '')
-        display_name = get_display_name(base_name)
-        INDICATOR_MAPPING[display_name] = base_name
-        print(f"Mapping créé : '{display_name}' -> '{base_name}'")
+def lttb_downsample(x, y, threshold):
+    """Sous-échantillonne des séries partageant le même axe x (LTTB).
+
+    Applique l'algorithme Largest-Triangle-Three-Buckets à toutes les lignes
+    de la matrice y en même temps : seule la boucle sur les seaux reste en
+    Python. Chaque ligne est d'abord réduite à sa plage observée, pour ne
+    pas dépenser de points sur des valeurs manquantes en début ou en fin de
+    série. Retourne les matrices x et y d'au plus `threshold` colonnes,
+    complétées par des NaN pour les séries plus courtes.
+    """
+    n_series, n_points = y.shape
+    if threshold < 3:
+        return np.broadcast_to(x, y.shape), y
+    
+    width = min(threshold, n_points)
+    out_x = np.full((n_series, width), np.nan)
+    out_y = np.full((n_series, width), np.nan)
+    
+    # Plage observée de chaque ligne ; les lignes de même plage sont traitées ensemble
+    valid = ~np.isnan(y)
+    has_values = valid.any(axis=1)
+    first = valid.argmax(axis=1)
+    last = n_points - 1 - valid[:, ::-1].argmax(axis=1)
+    spans, span_ids = np.unique(np.stack([first, last], axis=1)[has_values],
+                                axis=0, return_inverse=True)
+    span_rows = np.flatnonzero(has_values)
+    
+    for k, (span_first, span_last) in enumerate(spans):
+        rows = span_rows[span_ids.ravel() == k]
+        sub_x, sub_y = _lttb_rows(x[span_first:span_last + 1],
+                                  y[rows, span_first:span_last + 1], threshold)
+        out_x[rows, :sub_x.shape[1]] = sub_x
+        out_y[rows, :sub_y.shape[1]] = sub_y
+    
+    return out_x, out_y
+
+def _flatten_series(x, y, names):
+    """Concatène des séries en une seule trace, séparées par des NaN.
+
+    Les NaN de complément (séries plus courtes) sont retirés ; seuls les
+    séparateurs restent.
+    """
+    n_series, width = x.shape
+    separator = np.full((n_series, 1), np.nan)
+    flat_x = np.hstack([x, separator]).ravel()
+    flat_y = np.hstack([y, separator]).ravel()
+    flat_names = np.repeat(names, width + 1)
+    
+    keep = ~np.isnan(flat_x)
+    keep[width::width + 1] = True
+    return flat_x[keep], flat_y[keep], flat_names[keep]
+
+def plan_evolution_budget(n_series, n_years, extra_per_series=0):
+    """Répartit MAX_EVOLUTION_POINTS entre les séries du graphique de tous les pays.
+
+    Retourne le nombre de séries affichées, le nombre de points par série et
+    si les séries écartées doivent être résumées par des bandes (moyenne,
+    minimum et maximum annuels). Les séparateurs NaN comptent dans le budget,
+    ainsi que `extra_per_series` points par série (segments projetés).
+    """
+    cost = MIN_POINTS_PER_SERIES + 1 + extra_per_series
+    if n_series * cost <= MAX_EVOLUTION_POINTS:
+        per_series = MAX_EVOLUTION_POINTS // max(n_series, 1) - 1 - extra_per_series
+        return n_series, min(n_years, per_series), False
+    
+    # Trop de séries : réserver la place des trois bandes, puis échantillonner
+    remaining = MAX_EVOLUTION_POINTS - 3 * (min(n_years, BAND_POINTS) + 1)
+    shown = remaining // cost
+    return shown, min(n_years, remaining // shown - 1 - extra_per_series), True
+
+def select_series(latest, max_series):
+    """Choisit les séries affichées quand elles sont trop nombreuses.
+
+    Les principaux pays sont gardés en priorité, puis les valeurs récentes
+    les plus basses et les plus hautes, le reste étant tiré au hasard (de
+    façon reproductible). `latest` associe chaque pays à sa dernière valeur.
+    """
+    principal = latest.index[latest.index.isin(REAL_COUNTRIES.keys())][:max_series]
+    others = latest.drop(principal).sort_values()
+    quota = max_series - len(principal)
+    
+    n_extreme = quota // 4
+    observed = others.dropna().index
+    extremes = observed[:n_extreme].union(observed[len(observed) - n_extreme:] if n_extreme else observed[:0])
+    rest = others.index.difference(extremes)
+    sampled = np.random.default_rng(0).choice(rest.to_numpy(), size=min(len(rest), quota - len(extremes)),
+                                              replace=False)
+    return principal.union(extremes).union(pd.Index(sampled)).tolist()
+
+def create_all_countries_evolution(df, indicator, stats=None):
+    """Créer le graphique d'évolution de tous les pays pour un indicateur.
+
+    Chaque groupe de pays tient dans une seule trace Scattergl, les séries
+    étant séparées par des NaN. Le total de points reste sous
+    MAX_EVOLUTION_POINTS : les séries sont sous-échantillonnées et, si elles
+    sont trop nombreuses, seul un échantillon est tracé et l'ensemble est
+    résumé par des bandes tirées de `stats` (statistiques annuelles).
+    Les valeurs projetées forment une trace pointillée distincte.
+    La dernière trace, vide, reçoit le pays survolé.
+    """
+    fig = go.Figure()
+    if df.empty:
+        return fig
+    
+    matrix = to_matrix(df)
+    if 'estime' in df and df['estime'].any():
+        estimated = to_matrix(df.assign(valeur=df['estime'].astype(float)))
+        estimated = estimated.reindex_like(matrix).fillna(0).astype(bool)
+        extra = PROJECTION_HORIZON + 2
+    else:
+        estimated = pd.DataFrame(False, index=matrix.index, columns=matrix.columns)
+        extra = 0
+    
+    if stats is None:
+        n_series, threshold, with_bands = plan_evolution_budget(*matrix.shape, extra)
+        if with_bands:
+            stats = compute_yearly_stats(df)
+            latest = matrix.ffill(axis=1).iloc[:, -1]
+            matrix = matrix.loc[select_series(latest, n_series)]
+            estimated = estimated.loc[matrix.index]
+    else:
+        # Données déjà réduites à l'échantillon (stockage partitionné)
+        remaining = MAX_EVOLUTION_POINTS - 3 * (min(len(stats), BAND_POINTS) + 1)
+        threshold = min(matrix.shape[1], remaining // max(len(matrix), 1) - 1 - extra)
+    
+    years = matrix.columns.to_numpy(dtype=float)
+    values = matrix.to_numpy(dtype=float)
+    countries = matrix.index.to_numpy()
+    
+    # Séparer les projections : les courbes s'arrêtent à la dernière observation
+    positions = np.arange(len(years))
+    observed = ~np.isnan(values) & ~estimated.to_numpy()
+    last_observed = np.where(observed, positions, -1).max(axis=1)[:, None]
+    projected = (positions >= last_observed) & (last_observed >= 0) & ~np.isnan(values)
+    has_projection = (projected & (positions > last_observed)).any(axis=1)
+    values = np.where(positions > last_observed, np.nan, values)
+    
+    unit = UNITS.get(indicator, '')
+    
+    if stats is not None and not stats.empty:
+        # Bandes résumant toutes les séries, y compris celles non tracées
+        band_years = stats['annee'].to_numpy(dtype=float)
+        band_values = stats[['moyenne', 'minimum', 'maximum']].to_numpy(dtype=float).T
+        band_x, band_y, band_names = _flatten_series(
+            *lttb_downsample(band_years, band_values, BAND_POINTS),
+            np.array(['Moyenne', 'Minimum', 'Maximum']))
         
-        datasets[base_name] = load_data(base_name)
-        print(f"Données chargées pour {base_name}")
+        fig.add_trace(
+            go.Scattergl(
+                x=band_x,
+                y=band_y,
+                mode='lines',
+                name='Moyenne, minimum et maximum (toutes les séries)',
+                line=dict(color='black', width=2, dash='dot'),
+                customdata=band_names,
+                hovertemplate="%{customdata}<br>" +
+                             "%{x}: %{y:,.2f} " + unit +
+                             "<extra></extra>"
+            )
+        )
+    groups = {
+        'Principaux pays': (matrix.index.isin(REAL_COUNTRIES.keys()), 'rgba(31,119,180,0.5)'),
+        'Autres pays et régions': (~matrix.index.isin(REAL_COUNTRIES.keys()), 'rgba(127,127,127,0.3)')
+    }
+    
+    for group_name, (mask, color) in groups.items():
+        mask = mask & ~np.isnan(values).all(axis=1)
+        if not mask.any():
+            continue
+        # Une colonne de NaN sépare les séries dans une même trace
+        x, y, names = _flatten_series(*lttb_downsample(years, values[mask], threshold),
+                                      countries[mask])
+        
+        fig.add_trace(
+            go.Scattergl(
+                x=x,
+                y=y,
+                mode='lines',
+                name=group_name,
+                line=dict(color=color, width=1),
+                customdata=names,
+                hovertemplate="%{customdata}<br>" +
+                             "%{x}: %{y:,.2f} " + unit +
+                             "<extra></extra>"
+            )
+        )
+    
+    if has_projection.any():
+        # Segments projetés, depuis la dernière observation de chaque série
+        rows = projected[has_projection]
+        x, y, names = _flatten_series(
+            np.where(rows, years, np.nan),
+            np.where(rows, matrix.to_numpy(dtype=float)[has_projection], np.nan),
+            countries[has_projection])
+        
+        fig.add_trace(
+            go.Scattergl(
+                x=x,
+                y=y,
+                mode='lines',
+                name='Projections',
+                line=dict(color='rgba(255,127,14,0.6)', width=1, dash='dot'),
+                customdata=names,
+                hovertemplate="%{customdata} (estimé)<br>" +
+                             "%{x}: %{y:,.2f} " + unit +
+                             "<extra></extra>"
+            )
+        )
+    
+    # Trace de mise en évidence du pays survolé
+    fig.add_trace(
+        go.Scattergl(
+            x=[],
+            y=[],
+            mode='lines',
+            name='',
+            showlegend=False,
+            line=dict(color='#d62728', width=3),
+            hovertemplate="%{customdata}<br>" +
+                         "%{x}: %{y:,.2f} " + unit +
+                         "<extra></extra>"
+        )
+    )
+    
+    title = f"Évolution de tous les pays - {get_display_name(indicator)}"
+    if stats is not None:
+        title += f" (échantillon de {len(countries)} séries)"
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Année",
+        yaxis_title=unit,
+        hovermode='closest'
+    )
+    
+    return fig
 
-# Afficher le mapping pour débogage
-print("\nMapping des indicateurs :")
-for display_name, file_name in INDICATOR_MAPPING.items():
-    print(f"- {display_name} -> {file_name}")
+# Données chargées en mémoire (indicateurs CSV), remplies par load_datasets
+datasets = {}
 
-print("\nIndicateurs disponibles :")
-for indicator in datasets.keys():
-    print(f"- {indicator}")
+def load_datasets():
+    """Recense les indicateurs et charge les données en mémoire.
+    
+    Appelée uniquement depuis le processus principal : les processus
+    d'export reçoivent les données par leur initialiseur.
+    """
+    print("\nChargement des données...")
+    data_dir = DATA_DIR
+    
+    # Les indicateurs partitionnés (un dossier par indicateur) sont lus à la demande
+    for entry in os.listdir(data_dir):
+        if os.path.isdir(os.path.join(data_dir, entry)) and not entry.startswith('.'):
+            if pads is None:
+                print(f"pyarrow n'est pas installé : le dossier partitionné '{entry}' est ignoré")
+            elif is_partitioned_dataset(entry):
+                PARTITIONED_INDICATORS.add(entry)
+            else:
+                print(f"Le dossier '{entry}' n'est pas un indicateur partitionné lisible : ignoré")
+    
+    # Créer le mapping des indicateurs et charger les données
+    print("\nCréation du mapping des indicateurs...")
+    for file in os.listdir(data_dir):
+        base_name = file.replace('.csv', '')
+        if base_name in PARTITIONED_INDICATORS and file == base_name:
+            INDICATOR_MAPPING[get_display_name(base_name)] = base_name
+            print(f"Données partitionnées pour {base_name} (lecture à la demande)")
+            if os.path.exists(os.path.join(data_dir, f"{base_name}.csv")):
+                print(f"Attention : {base_name}.csv est ignoré au profit du dossier partitionné")
+        elif file.endswith('.csv') and base_name not in PARTITIONED_INDICATORS:
+            display_name = get_display_name(base_name)
+            INDICATOR_MAPPING[display_name] = base_name
+            print(f"Mapping créé : '{display_name}' -> '{base_name}'")
+            
+            datasets[base_name] = fill_and_project(load_data(base_name), base_name)
+            print(f"Données chargées pour {base_name}")
+    
+    # Afficher le mapping pour débogage
+    print("\nMapping des indicateurs :")
+    for display_name, file_name in INDICATOR_MAPPING.items():
+        print(f"- {display_name} -> {file_name}")
+    
+    print("\nIndicateurs disponibles :")
+    for indicator in INDICATOR_MAPPING.values():
+        print(f"- {indicator}")
+    
+    return datasets
 
 # Définir l'indicateur par défaut
 DEFAULT_INDICATOR = 'taux_de_fécondité'
@@ -272,97 +905,85 @@ DEFAULT_YEAR = 2020
 # Initialiser l'application Dash avec le thème Bootstrap
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.FLATLY])
 
-# Créer la mise en page
-app.layout = dbc.Container([
-    dbc.Row([
-        dbc.Col([
-            html.H1("Tableau de bord des données démographiques mondiales",
-                   className="text-center mb-4")
-        ])
-    ]),
-    
-    dbc.Row([
-        dbc.Col([
-            html.Label("Sélectionner un indicateur :"),
-            dcc.Dropdown(
-                id='indicator-selector',
-                options=[{'label': get_display_name(k), 'value': k} 
-                        for k in datasets.keys()],
-                value=DEFAULT_INDICATOR
-            ),
-            html.Br(),
-            html.Label("Sélectionner une année :"),
-            dcc.Slider(
-                id='year-slider',
-                min=1960,  # Début à 1960 (données les plus anciennes disponibles)
-                max=2025,  # Fin à 2025
-                value=2020,  # Valeur par défaut
-                marks={str(year): str(year) 
-                       for year in range(1960, 2026, 5)},  # Marques tous les 5 ans
-                step=1
-            )
-        ])
-    ]),
+# Créer la mise en page (évaluée à l'affichage, une fois les données chargées)
+def serve_layout():
+    return dbc.Container([
+        dbc.Row([
+            dbc.Col([
+                html.H1("Tableau de bord des données démographiques mondiales",
+                       className="text-center mb-4")
+            ])
+        ]),
     
-    dbc.Row([
-        dbc.Col([
-            dcc.Graph(id='world-map')
-        ])
-    ]),
-    
-    dbc.Row([
-        dbc.Col([
-            dcc.Graph(id='time-series')
-        ], width=8),
-        dbc.Col([
-            dcc.Graph(id='top-10-countries')
-        ], width=4)
-    ]),
-    
-    dbc.Row([
-        dbc.Col([
-            dcc.Graph(id='population-evolution')
-        ])
-    ])
-], fluid=True)
-
-@app.callback(
-    [Output('world-map', 'figure'),
-     Output('time-series', 'figure'),
-     Output('top-10-countries', 'figure'),
-     Output('population-evolution', 'figure')],
-    [Input('indicator-selector', 'value'),
-     Input('year-slider', 'value')]
-)
-def update_figures(indicator, year):
-    print(f"\nMise à jour des figures pour l'indicateur '{indicator}' et l'année {year}")
+        dbc.Row([
+            dbc.Col([
+                html.Label("Sélectionner un indicateur :"),
+                dcc.Dropdown(
+                    id='indicator-selector',
+                    options=[{'label': get_display_name(k), 'value': k} 
+                            for k in INDICATOR_MAPPING.values()],
+                    value=DEFAULT_INDICATOR
+                ),
+                html.Br(),
+                html.Label("Sélectionner une année :"),
+                dcc.Slider(
+                    id='year-slider',
+                    min=FIRST_YEAR,  # Début à 1960 (données les plus anciennes disponibles)
+                    max=LAST_YEAR,  # Fin à 2025 (années récentes projetées)
+                    value=2020,  # Valeur par défaut
+                    marks={str(year): str(year) 
+                           for year in range(FIRST_YEAR, LAST_YEAR + 1, 5)},  # Marques tous les 5 ans
+                    step=1
+                )
+            ])
+        ]),
     
-    if indicator not in datasets:
-        print(f"Erreur : indicateur '{indicator}' non trouvé dans datasets")
-        print("Indicateurs disponibles :", list(datasets.keys()))
-        # Retourner des figures vides en cas d'erreur
-        empty_fig = go.Figure()
-        return empty_fig, empty_fig, empty_fig, empty_fig
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='world-map')
+            ])
+        ]),
     
-    data = datasets[indicator]
-    year_str = str(year)
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='time-series')
+            ], width=8),
+            dbc.Col([
+                dcc.Graph(id='top-10-countries')
+            ], width=4)
+        ]),
     
-    # Préparer les données pour la carte
-    countries = []
-    codes = []
-    values = []
-    
-    if year in data['annee'].values:
-        for index, row in data.iterrows():
-            if row['annee'] == year:
-                countries.append(row['pays'])
-                codes.append(row['code_pays'])
-                values.append(row['valeur'])
-                
-        print(f"Données pour la carte : {len(countries)} pays")
-    else:
-        print(f"Pas de données pour l'année {year}")
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='population-evolution')
+            ])
+        ]),
     
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='all-countries-evolution')
+            ])
+        ])
+    ], fluid=True)
+
+app.layout = serve_layout
+
+def load_indicator_history(indicator):
+    """Retourne les statistiques annuelles et la dernière année observée d'un indicateur."""
+    if indicator in PARTITIONED_INDICATORS:
+        return load_yearly_stats(indicator), np.nan
+    data = datasets[indicator]
+    return compute_yearly_stats(data), data.loc[~data['estime'], 'annee'].max()
+
+def load_year_data(indicator, year):
+    """Retourne les données utiles aux figures d'une année."""
+    if indicator in PARTITIONED_INDICATORS:
+        # Seule la partition de l'année sélectionnée est chargée
+        return load_year(indicator, year)
+    return datasets[indicator]
+
+def create_world_map(data, indicator, year):
+    """Créer la carte du monde d'un indicateur pour une année."""
     if indicator == 'taux_de_mortalité':
         # Trier les pays par valeur décroissante et obtenir le top 10
         top_10 = data[data['annee'] == year].nlargest(10, 'valeur')
@@ -397,41 +1018,37 @@ def update_figures(indicator, year):
                                hover_name='pays',
                                color_continuous_scale=COLOR_SCALES[indicator])
     
+    # Souligner les pays dont la valeur est estimée
+    estimated = data[(data['annee'] == year) & data['estime']]
+    if not estimated.empty:
+        fig_world_map.add_trace(
+            go.Choropleth(
+                locations=estimated['code_pays'],
+                z=[1] * len(estimated),
+                colorscale=[[0, 'rgba(0,0,0,0)'], [1, 'rgba(0,0,0,0)']],
+                showscale=False,
+                hoverinfo='skip',
+                marker_line_color='black',
+                marker_line_width=1.5
+            )
+        )
+    
     fig_world_map.update_layout(
         title=f"{get_display_name(indicator)} par pays en {year}",
         coloraxis_colorbar_title=UNITS[indicator]
     )
     
-    # Calculer les statistiques par année
-    years = sorted(data['annee'].unique())
-    avg_values = []
-    min_values = []
-    max_values = []
-    min_countries = []
-    max_countries = []
-    
-    for year in years:
-        year_data = data[data['annee'] == year]
-        if not year_data.empty:
-            avg = year_data['valeur'].mean()
-            min_val = year_data['valeur'].min()
-            max_val = year_data['valeur'].max()
-            
-            # Trouver les pays avec les valeurs min et max
-            min_country = year_data[year_data['valeur'] == min_val]['pays'].iloc[0]
-            max_country = year_data[year_data['valeur'] == max_val]['pays'].iloc[0]
-            
-            avg_values.append(avg)
-            min_values.append(min_val)
-            max_values.append(max_val)
-            min_countries.append(min_country)
-            max_countries.append(max_country)
-        else:
-            avg_values.append(None)
-            min_values.append(None)
-            max_values.append(None)
-            min_countries.append('')
-            max_countries.append('')
+    return fig_world_map
+
+def create_time_series(indicator, stats, last_observed):
+    """Créer le graphique de la moyenne, du minimum et du maximum annuels."""
+    # Statistiques par année
+    years = stats['annee'].astype(int).tolist()
+    avg_values = stats['moyenne'].tolist()
+    min_values = stats['minimum'].tolist()
+    max_values = stats['maximum'].tolist()
+    min_countries = stats['pays_min'].tolist()
+    max_countries = stats['pays_max'].tolist()
     
     # Créer le graphique temporel avec les trois courbes
     fig_time_series = go.Figure()
@@ -496,6 +1113,18 @@ def update_figures(indicator, year):
         )
     )
     
+    # Signaler la période projetée au-delà des dernières observations
+    if pd.notna(last_observed) and last_observed < years[-1]:
+        fig_time_series.add_vrect(
+            x0=last_observed,
+            x1=years[-1],
+            fillcolor='lightgray',
+            opacity=0.3,
+            line_width=0,
+            annotation_text="Projection",
+            annotation_position="top left"
+        )
+    
     fig_time_series.update_layout(
         title=f"Évolution temporelle - {get_display_name(indicator)}",
         xaxis_title="Année",
@@ -504,21 +1133,14 @@ def update_figures(indicator, year):
         showlegend=True
     )
     
-    if year not in data['annee'].values:
-        print(f"Pas de données pour l'année {year}")
-        return fig_world_map, fig_time_series, go.Figure(), go.Figure()
-    
+    return fig_time_series
+
+def create_top10_bars(data, indicator, year):
+    """Créer le graphique en barres des 10 premiers pays pour une année."""
     # Préparer les données pour le top 10
-    countries = []
-    values = []
-    for index, row in data.iterrows():
-        if row['annee'] == year:
-            countries.append(row['pays'])
-            values.append(row['valeur'])
-    
-    # Trier et prendre les 10 premiers
-    sorted_data = sorted(zip(countries, values), key=lambda x: x[1], reverse=True)
-    top_10 = sorted_data[:10]
+    top_10_data = data[data['annee'] == year].nlargest(10, 'valeur')
+    top_10 = list(zip(top_10_data['pays'], top_10_data['valeur']))
+    top_10_estimated = top_10_data['estime'].tolist()
     
     print(f"Top 10 calculé : {len(top_10)} pays")
     
@@ -554,8 +1176,11 @@ def update_figures(indicator, year):
             x=[country for country, _ in top_10],
             y=[value for _, value in top_10],
             marker_color=color_scale,
+            # Hachurer les barres dont la valeur est estimée
+            marker_pattern_shape=['/' if e else '' for e in top_10_estimated],
+            customdata=[' (estimé)' if e else '' for e in top_10_estimated],
             hovertemplate="Pays: %{x}<br>" +
-                         f"Valeur: %{{y:.2f}} {UNITS[indicator]}<br>" +
+                         f"Valeur: %{{y:.2f}} {UNITS[indicator]}%{{customdata}}<br>" +
                          "<extra></extra>"
         )
     ])
@@ -567,14 +1192,236 @@ def update_figures(indicator, year):
         xaxis_tickangle=-45
     )
     
+    return fig_top_10
+
+def create_population_evolution(indicator, data):
+    """Créer le graphique d'évolution des pays les plus peuplés (population totale uniquement)."""
     if indicator == 'population_totale':
-        evolution_fig = create_top10_evolution(data)
+        if indicator in PARTITIONED_INDICATORS:
+            # Historique complet des seuls pays candidats au top 10
+            history = load_data(indicator, countries=list(REAL_COUNTRIES))
+        else:
+            history = data
+        evolution_fig = create_top10_evolution(history)
     else:
         evolution_fig = go.Figure()  # Figure vide pour les autres indicateurs
     
+    return evolution_fig
+
+@app.callback(
+    [Output('world-map', 'figure'),
+     Output('time-series', 'figure'),
+     Output('top-10-countries', 'figure'),
+     Output('population-evolution', 'figure')],
+    [Input('indicator-selector', 'value'),
+     Input('year-slider', 'value')]
+)
+def update_figures(indicator, year):
+    print(f"\nMise à jour des figures pour l'indicateur '{indicator}' et l'année {year}")
+    
+    if indicator not in INDICATOR_MAPPING.values():
+        print(f"Erreur : indicateur '{indicator}' non trouvé dans datasets")
+        print("Indicateurs disponibles :", list(INDICATOR_MAPPING.values()))
+        # Retourner des figures vides en cas d'erreur
+        empty_fig = go.Figure()
+        return empty_fig, empty_fig, empty_fig, empty_fig
+    
+    data = load_year_data(indicator, year)
+    stats, last_observed = load_indicator_history(indicator)
+    
+    # Préparer les données pour la carte
+    if year in data['annee'].values:
+        print(f"Données pour la carte : {int((data['annee'] == year).sum())} pays")
+    else:
+        print(f"Pas de données pour l'année {year}")
+    
+    fig_world_map = create_world_map(data, indicator, year)
+    fig_time_series = create_time_series(indicator, stats, last_observed)
+    
+    if year not in data['annee'].values:
+        print(f"Pas de données pour l'année {year}")
+        return fig_world_map, fig_time_series, go.Figure(), go.Figure()
+    
+    fig_top_10 = create_top10_bars(data, indicator, year)
+    evolution_fig = create_population_evolution(indicator, data)
+    
     return fig_world_map, fig_time_series, fig_top_10, evolution_fig
 
+@app.callback(
+    Output('all-countries-evolution', 'figure'),
+    [Input('indicator-selector', 'value'),
+     Input('all-countries-evolution', 'hoverData')]
+)
+def update_all_countries_evolution(indicator, hover_data):
+    if indicator not in INDICATOR_MAPPING.values():
+        return go.Figure()
+    
+    if ctx.triggered_id != 'all-countries-evolution':
+        evolution_data, evolution_stats = load_evolution_data(indicator)
+        return create_all_countries_evolution(evolution_data, indicator, evolution_stats)
+    
+    if not hover_data or 'customdata' not in hover_data['points'][0]:
+        return dash.no_update
+    
+    # Ne renvoyer que la trace mise en évidence, en pleine résolution
+    country = hover_data['points'][0]['customdata']
+    if indicator in PARTITIONED_INDICATORS:
+        country_data = load_data(indicator, countries=[country])
+    else:
+        country_data = datasets[indicator][datasets[indicator]['pays'] == country]
+    country_data = country_data.sort_values('annee')
+    
+    patched_fig = Patch()
+    patched_fig['data'][-1]['x'] = country_data['annee'].tolist()
+    patched_fig['data'][-1]['y'] = country_data['valeur'].tolist()
+    patched_fig['data'][-1]['customdata'] = [country] * len(country_data)
+    patched_fig['data'][-1]['name'] = country
+    return patched_fig
+
+def _init_export_worker(shared_datasets, indicator_mapping, partitioned_indicators):
+    """Installe les données déjà chargées dans un processus d'export."""
+    datasets.update(shared_datasets)
+    INDICATOR_MAPPING.update(indicator_mapping)
+    PARTITIONED_INDICATORS.update(partitioned_indicators)
+
+def _write_report(output_dir, filename, title, figures, fmt, overview=None):
+    """Écrit un rapport HTML ou JSON contenant les figures nommées non vides."""
+    figures = {name: fig for name, fig in figures.items() if fig.data}
+    
+    if fmt == 'json':
+        report = {'titre': title}
+        if overview:
+            report['vue_ensemble'] = overview
+        report['figures'] = {name: json.loads(pio.to_json(fig))
+                             for name, fig in figures.items()}
+        content = json.dumps(report, ensure_ascii=False)
+    else:
+        # plotly.min.js est écrit une seule fois dans le dossier du rapport
+        divs = [pio.to_html(fig, full_html=False, include_plotlyjs=False)
+                for fig in figures.values()]
+        link = ''
+        if overview:
+            link = f'<p><a href="{html_lib.escape(overview)}">Vue d\'ensemble</a></p>\n'
+        content = (
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{html_lib.escape(title)}</title>\n"
+            "<script src=\"plotly.min.js\"></script>\n</head>\n<body>\n"
+            f"<h1>{html_lib.escape(title)}</h1>\n" + link + "\n".join(divs) +
+            "\n</body>\n</html>\n"
+        )
+    
+    with open(os.path.join(output_dir, filename), 'w', encoding='utf-8') as f:
+        f.write(content)
+    return filename
+
+def render_overview(task):
+    """Génère la vue d'ensemble d'un indicateur (figures indépendantes de l'année)."""
+    indicator, output_dir, fmt = task
+    
+    # Les traces des fonctions de chargement n'ont pas d'intérêt en mode export
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, last_observed = load_indicator_history(indicator)
+        evolution_data, evolution_stats = load_evolution_data(indicator)
+        figures = {
+            'time-series': create_time_series(indicator, stats, last_observed),
+            'population-evolution': create_population_evolution(
+                indicator, load_year_data(indicator, DEFAULT_YEAR)),
+            'all-countries-evolution': create_all_countries_evolution(
+                evolution_data, indicator, evolution_stats)
+        }
+    
+    return _write_report(output_dir, f"{indicator}.{fmt}", get_display_name(indicator),
+                         figures, fmt)
+
+def render_report(task):
+    """Génère le rapport d'un indicateur pour une année et retourne son nom de fichier."""
+    indicator, year, output_dir, fmt = task
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_year_data(indicator, year)
+        figures = {'world-map': create_world_map(data, indicator, year)}
+        if year in data['annee'].values:
+            figures['top-10-countries'] = create_top10_bars(data, indicator, year)
+    
+    # Les figures indépendantes de l'année sont dans la vue d'ensemble
+    return _write_report(output_dir, f"{indicator}_{year}.{fmt}",
+                         f"{get_display_name(indicator)} ({year})", figures, fmt,
+                         overview=f"{indicator}.{fmt}")
+
+def write_report_index(output_dir, overviews, reports):
+    """Écrit la page d'index listant les rapports générés par indicateur."""
+    sections = []
+    for indicator, links in reports.items():
+        items = "\n".join(f'<li><a href="{html_lib.escape(filename)}">{year}</a></li>'
+                          for year, filename in links)
+        sections.append(f"<h2>{html_lib.escape(get_display_name(indicator))}</h2>\n"
+                        f'<p><a href="{html_lib.escape(overviews[indicator])}">Vue d\'ensemble</a></p>\n'
+                        f"<ul>\n{items}\n</ul>")
+    
+    content = (
+        "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+        "<title>Rapports démographiques</title>\n</head>\n<body>\n"
+        "<h1>Rapports démographiques</h1>\n"
+        f"<p>Généré le {datetime.now():%d/%m/%Y %H:%M}</p>\n" +
+        "\n".join(sections) + "\n</body>\n</html>\n"
+    )
+    with open(os.path.join(output_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def export_reports(output_dir, fmt='html', all_years=False, year=DEFAULT_YEAR, workers=None):
+    """Exporte les rapports statiques de tous les indicateurs en parallèle.
+
+    Les données déjà chargées sont transmises une seule fois à chaque
+    processus par son initialiseur, et non relues à chaque rapport. La
+    méthode de démarrage par défaut de la plateforme est conservée.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if fmt == 'html':
+        with open(os.path.join(output_dir, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+    
+    years = range(FIRST_YEAR, LAST_YEAR + 1) if all_years else [year]
+    indicators = list(INDICATOR_MAPPING.values())
+    overview_tasks = [(indicator, output_dir, fmt) for indicator in indicators]
+    tasks = [(indicator, y, output_dir, fmt) for indicator in indicators for y in years]
+    
+    n_workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=n_workers,
+                             initializer=_init_export_worker,
+                             initargs=(datasets, INDICATOR_MAPPING,
+                                       PARTITIONED_INDICATORS)) as executor:
+        # Une vue d'ensemble par indicateur, puis un rapport léger par année
+        overview_files = executor.map(render_overview, overview_tasks)
+        filenames = list(executor.map(render_report, tasks,
+                                      chunksize=max(1, len(tasks) // (4 * n_workers))))
+        overviews = dict(zip(indicators, overview_files))
+    
+    reports = {}
+    for (indicator, y, _, _), filename in zip(tasks, filenames):
+        reports.setdefault(indicator, []).append((y, filename))
+    write_report_index(output_dir, overviews, reports)
+    
+    print(f"{len(overviews)} vues d'ensemble et {len(filenames)} rapports exportés dans {output_dir}")
+
 if __name__ == '__main__':
-    print("Démarrage du tableau de bord...")
-    print("Ouvrez votre navigateur à l'adresse : http://127.0.0.1:8050")
-    app.run_server(debug=True)
+    parser = argparse.ArgumentParser(description="Tableau de bord des données démographiques mondiales")
+    parser.add_argument('--export', metavar='DOSSIER',
+                        help="Exporter des rapports statiques dans ce dossier au lieu de lancer le serveur")
+    parser.add_argument('--format', choices=['html', 'json'], default='html',
+                        help="Format des rapports exportés (défaut : html)")
+    parser.add_argument('--annee', type=int, default=DEFAULT_YEAR,
+                        help=f"Année des rapports exportés (défaut : {DEFAULT_YEAR})")
+    parser.add_argument('--toutes-annees', action='store_true',
+                        help="Exporter un rapport pour chaque année")
+    parser.add_argument('--processus', type=int, default=None,
+                        help="Nombre de processus d'export (défaut : nombre de cœurs)")
+    args = parser.parse_args()
+    
+    load_datasets()
+    if args.export:
+        export_reports(args.export, fmt=args.format, all_years=args.toutes_annees,
+                       year=args.annee, workers=args.processus)
+    else:
+        print("Démarrage du tableau de bord...")
+        print("Ouvrez votre navigateur à l'adresse : http://127.0.0.1:8050")
+        app.run_server(debug=True)